@@ -0,0 +1,369 @@
+# Date: 10/19/26
+# Description: This program analyses archived Hasami Shogi games in parallel.
+# Games are read lazily from a JSONL archive, replayed through HasamiShogiGame
+# in a pool of worker processes, and annotated with a shallow material search.
+# Annotations are written as a JSONL stream and progress is checkpointed so an
+# interrupted run can be resumed.
+
+import argparse
+import json
+import os
+from collections import deque
+from multiprocessing import Pool
+
+from HasamiShogiGame import HasamiShogiGame
+
+WIN_SCORE = 100  # larger than any possible material difference
+
+
+def opponent_of(color: str) -> str:
+    """
+    Return the opponent of color.
+    :param color: str, either 'RED' or 'BLACK'
+    :return: str
+    """
+    if color == 'RED':
+        return 'BLACK'
+    return 'RED'
+
+
+def evaluate(game: HasamiShogiGame, color: str) -> int:
+    """
+    Return the static evaluation of game from color's point of view: the
+    difference in pawn counts, or +/- WIN_SCORE if the game is over.
+    :param game: HasamiShogiGame
+    :param color: str, player whose point of view is used
+    :return: int
+    """
+    state = game.get_game_state()
+    if state == color + '_WON':
+        return WIN_SCORE
+    if state != 'UNFINISHED':
+        return -WIN_SCORE
+    board = game.get_board()
+    return board.get_num_pawns(color) - board.get_num_pawns(opponent_of(color))
+
+
+def search(game: HasamiShogiGame, depth: int) -> int:
+    """
+    Return the negamax value of game for the active player, searching depth
+    plies ahead and evaluating the leaves by material.
+    :param game: HasamiShogiGame
+    :param depth: int, number of plies to search
+    :return: int
+    """
+    color = game.get_active_player()
+    if depth <= 0:
+        return evaluate(game, color)
+    moves = game.get_legal_moves()
+    if not moves:
+        return evaluate(game, color)
+    best = -WIN_SCORE
+    for src_pos, dest_pos in moves:
+        child = game.copy()
+        child.apply_move(src_pos, dest_pos)
+        best = max(best, -search(child, depth - 1))
+    return best
+
+
+def count_captures(game: HasamiShogiGame, child: HasamiShogiGame) -> int:
+    """
+    Return the number of opponent pawns captured between game and child, the
+    position reached after the active player of game has moved.
+    :param game: HasamiShogiGame, position before the move
+    :param child: HasamiShogiGame, position after the move
+    :return: int
+    """
+    opponent = opponent_of(game.get_active_player())
+    return game.get_board().get_num_pawns(opponent) - \
+        child.get_board().get_num_pawns(opponent)
+
+
+def analyze_game(record: dict, depth: int = 1,
+                 swing_threshold: int = 1) -> dict:
+    """
+    Replay an archived game and annotate it. For every position the played
+    move is compared with the best move found by a depth-ply search.
+    Annotations include the evaluation after every ply (from Black's point of
+    view), the plies where a better capture was available (missed captures),
+    and the plies that lost at least swing_threshold pawns of evaluation
+    (evaluation swings). Replay stops at the first malformed or illegal move;
+    a record that is not a game is annotated with an error and no plies.
+    :param record: dict with a 'game_id' and a list of [src_pos, dest_pos]
+    'moves'
+    :param depth: int, search depth in plies (at least 1)
+    :param swing_threshold: int, smallest evaluation loss reported as a swing
+    :return: dict, JSON-serializable annotation of the game
+    """
+    game = HasamiShogiGame()
+    evaluations = []
+    swings = []
+    missed_captures = []
+    error = None
+
+    if not isinstance(record, dict):
+        error = {'reason': 'record is not an object'}
+        record = {}
+    moves = record.get('moves', [])
+    if not isinstance(moves, list):
+        error = {'reason': 'moves is not a list'}
+        moves = []
+
+    for ply, move in enumerate(moves, start=1):
+        if not isinstance(move, list) or len(move) != 2 or \
+                not all(isinstance(pos, str) for pos in move):
+            error = {'ply': ply, 'move': move, 'reason': 'malformed move'}
+            break
+        src_pos, dest_pos = move
+        color = game.get_active_player()
+        legal_moves = game.get_legal_moves()
+        if (src_pos, dest_pos) not in legal_moves:
+            error = {'ply': ply, 'move': [src_pos, dest_pos],
+                     'reason': 'illegal move'}
+            break
+
+        best_value = -WIN_SCORE
+        best_move = None
+        best_captures = 0
+        played_value = None
+        played_captures = 0
+        for candidate in legal_moves:
+            child = game.copy()
+            child.apply_move(candidate[0], candidate[1])
+            value = -search(child, depth - 1)
+            captures = count_captures(game, child)
+            if value > best_value:
+                best_value = value
+                best_move = candidate
+            best_captures = max(best_captures, captures)
+            if candidate == (src_pos, dest_pos):
+                played_value = value
+                played_captures = captures
+
+        loss = best_value - played_value
+        if loss >= swing_threshold:
+            swings.append({'ply': ply, 'player': color,
+                           'move': [src_pos, dest_pos],
+                           'best_move': list(best_move),
+                           'loss': loss})
+        if best_captures > played_captures:
+            missed_captures.append({'ply': ply, 'player': color,
+                                    'move': [src_pos, dest_pos],
+                                    'captured': played_captures,
+                                    'available': best_captures})
+
+        game.apply_move(src_pos, dest_pos)
+        evaluations.append(evaluate(game, 'BLACK'))
+
+    annotation = {
+        'game_id': record.get('game_id'),
+        'plies': len(evaluations),
+        'result': game.get_game_state(),
+        'evaluations': evaluations,
+        'swings': swings,
+        'missed_captures': missed_captures,
+    }
+    if error is not None:
+        annotation['error'] = error
+    return annotation
+
+
+def analyze_line(line: str, depth: int = 1, swing_threshold: int = 1) -> dict:
+    """
+    Parse one archive line and annotate the game. A line that is not valid
+    JSON is annotated with an error instead of raising.
+    :param line: str, one line of the archive
+    :param depth: int, search depth in plies
+    :param swing_threshold: int, smallest evaluation loss reported as a swing
+    :return: dict, JSON-serializable annotation of the game
+    """
+    try:
+        record = json.loads(line)
+    except ValueError:
+        annotation = analyze_game(None, depth, swing_threshold)
+        annotation['error'] = {'reason': 'invalid JSON'}
+        return annotation
+    return analyze_game(record, depth, swing_threshold)
+
+
+def analyze_chunk(chunk: list, depth: int, swing_threshold: int) -> list:
+    """
+    Analyse a chunk of archive lines in a worker process. Returns one JSONL
+    line per game so the parent only has to write them out.
+    :param chunk: list of str, archive lines
+    :param depth: int, search depth in plies
+    :param swing_threshold: int, smallest evaluation loss reported as a swing
+    :return: list of str
+    """
+    return [json.dumps(analyze_line(line, depth, swing_threshold)) + '\n'
+            for line in chunk]
+
+
+def read_games(archive_path: str, skip: int = 0):
+    """
+    Lazily yield the lines of a JSONL archive, one game per line, skipping
+    blank lines and the first skip games. Lines are parsed by the workers.
+    :param archive_path: str, path of the archive
+    :param skip: int, number of games already analysed
+    :return: generator of strs
+    """
+    with open(archive_path, encoding='utf-8') as archive:
+        for line in archive:
+            if not line.strip():
+                continue
+            if skip > 0:
+                skip -= 1
+                continue
+            yield line
+
+
+def chunk_games(games, chunk_size: int):
+    """
+    Group an iterable of archive lines into lists of at most chunk_size.
+    :param games: iterable of strs
+    :param chunk_size: int
+    :return: generator of lists of strs
+    """
+    chunk = []
+    for record in games:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_checkpoint(checkpoint_path: str) -> dict:
+    """
+    Return the saved checkpoint, or an empty checkpoint if there is none.
+    :param checkpoint_path: str
+    :return: dict with 'games_done' and 'output_bytes'
+    """
+    if checkpoint_path is None or not os.path.exists(checkpoint_path):
+        return {'games_done': 0, 'output_bytes': 0}
+    with open(checkpoint_path, encoding='utf-8') as checkpoint:
+        return json.load(checkpoint)
+
+
+def save_checkpoint(checkpoint_path: str, games_done: int,
+                    output_bytes: int) -> None:
+    """
+    Atomically save the number of games analysed and the size of the output
+    file at that point.
+    :param checkpoint_path: str
+    :param games_done: int
+    :param output_bytes: int
+    :return: None
+    """
+    temp_path = checkpoint_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as checkpoint:
+        json.dump({'games_done': games_done, 'output_bytes': output_bytes},
+                  checkpoint)
+    os.replace(temp_path, checkpoint_path)
+
+
+def analyze_archive(archive_path: str, output_path: str,
+                    checkpoint_path: str = None, processes: int = None,
+                    chunk_size: int = 16, depth: int = 1,
+                    swing_threshold: int = 1) -> int:
+    """
+    Analyse every game in archive_path and write one annotation per line to
+    output_path, in archive order. Chunks of games are handed to a process
+    pool with at most two chunks per process in flight, so memory stays
+    bounded however large the archive is. After each chunk is written the
+    checkpoint is updated; if checkpoint_path exists the run resumes after
+    the last completed chunk, discarding any output written past it.
+    :param archive_path: str, JSONL archive of games
+    :param output_path: str, JSONL file of annotations
+    :param checkpoint_path: str or None, file used to resume the run
+    :param processes: int or None, number of worker processes (default: CPUs)
+    :param chunk_size: int, number of games per task
+    :param depth: int, search depth in plies
+    :param swing_threshold: int, smallest evaluation loss reported as a swing
+    :return: int, total number of games analysed including resumed ones
+    Raise ValueError if processes, chunk_size, or depth is less than 1, or
+    if resuming and output_path is missing or shorter than the checkpoint
+    says. The output is not touched when ValueError is raised.
+    """
+    if processes is not None and processes < 1:
+        raise ValueError(f"processes must be at least 1, got {processes}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if depth < 1:
+        raise ValueError(f"depth must be at least 1, got {depth}")
+    checkpoint = load_checkpoint(checkpoint_path)
+    games_done = checkpoint['games_done']
+    output_bytes = checkpoint['output_bytes']
+    if games_done and (not os.path.exists(output_path) or
+                       os.path.getsize(output_path) < output_bytes):
+        raise ValueError(f"cannot resume: {output_path} is missing or shorter "
+                         f"than the checkpoint {checkpoint_path}")
+    chunks = chunk_games(read_games(archive_path, games_done), chunk_size)
+
+    mode = 'r+' if games_done else 'w'
+    # build the pool first so a pool failure cannot truncate the output
+    with Pool(processes) as pool, \
+            open(output_path, mode, encoding='utf-8') as output:
+        output.seek(output_bytes if games_done else 0)
+        output.truncate()
+        max_in_flight = 2 * (processes or os.cpu_count() or 1)
+        pending = deque()
+        for chunk in chunks:
+            pending.append((len(chunk), pool.apply_async(
+                analyze_chunk, (chunk, depth, swing_threshold))))
+            if len(pending) >= max_in_flight:
+                games_done = _write_result(pending.popleft(), output,
+                                           checkpoint_path, games_done)
+        while pending:
+            games_done = _write_result(pending.popleft(), output,
+                                       checkpoint_path, games_done)
+    return games_done
+
+
+def _write_result(entry: tuple, output, checkpoint_path: str,
+                  games_done: int) -> int:
+    """
+    Wait for a chunk's annotations, write them to output, and checkpoint.
+    :param entry: tuple of (number of games, AsyncResult)
+    :param output: file object opened for writing
+    :param checkpoint_path: str or None
+    :param games_done: int, games analysed before this chunk
+    :return: int, games analysed including this chunk
+    """
+    num_games, result = entry
+    output.writelines(result.get())
+    output.flush()
+    games_done += num_games
+    if checkpoint_path is not None:
+        save_checkpoint(checkpoint_path, games_done, output.tell())
+    return games_done
+
+
+def main():
+    """
+    Main method to analyse an archive from the command line.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(
+        description="Annotate archived Hasami Shogi games in parallel.")
+    parser.add_argument('archive', help="JSONL file, one game per line")
+    parser.add_argument('output', help="JSONL file of annotations")
+    parser.add_argument('--checkpoint', help="checkpoint file for resuming")
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=16)
+    parser.add_argument('--depth', type=int, default=1)
+    parser.add_argument('--swing-threshold', type=int, default=1)
+    args = parser.parse_args()
+
+    try:
+        total = analyze_archive(args.archive, args.output, args.checkpoint,
+                                args.processes, args.chunk_size, args.depth,
+                                args.swing_threshold)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Analysed {total} games.")
+
+
+if __name__ == "__main__":
+    main()
@@ -41,6 +41,18 @@ class HasamiShogiGame:
         """
         self._board = new_board
 
+    def copy(self):
+        """
+        Return a new HasamiShogiGame with a copy of the Board and the same
+        active player.
+        :return: HasamiShogiGame
+        """
+        # skip __init__ so no starting board is built only to be replaced
+        new_game = HasamiShogiGame.__new__(HasamiShogiGame)
+        new_game._board = self._board.copy()
+        new_game._player_turn = self._player_turn
+        return new_game
+
     def get_player_turn(self) -> str:
         """
         Return active player's turn. Redundant with get_active_player but
@@ -111,33 +123,61 @@ class HasamiShogiGame:
         :param dest_pos: str, location of where to move the pawn
         :return: bool
         """
-        this_pawn = self._board.get_square(src_pos)
         if not self.validate_move(src_pos, dest_pos):
             print("Move is not valid!")
             return False
-        self._board.set_square(src_pos, Pawn(src_pos, 'NONE'))
-        self._board.set_square(dest_pos, this_pawn)
-        self.capture(dest_pos)
+        self.apply_move(src_pos, dest_pos)
         if self.get_game_state() == 'BLACK_WON':
             print("BLACK WINS THE GAME!")
         if self.get_game_state() == 'RED_WON':
             print("RED WINS THE GAME")
-        self.switch_turns()
         return True
 
+    def apply_move(self, src_pos: str, dest_pos: str) -> list:
+        """
+        Move the pawn at src_pos to dest_pos, capture any pawns in a captured
+        state, and switch turns. Does not validate the move or print anything;
+        used by make_move and by callers that have already checked legality.
+        Return the locations of the captured pawns.
+        :param src_pos: str, location of the pawn being moved
+        :param dest_pos: str, location of where to move the pawn
+        :return: list of str
+        """
+        this_pawn = self._board.get_square(src_pos)
+        self._board.set_square(src_pos, Pawn(src_pos, 'NONE'))
+        self._board.set_square(dest_pos, this_pawn)
+        captured = self.capture(dest_pos)
+        self.switch_turns()
+        return captured
+
     def validate_move(self, src_pos: str, dest_pos: str) -> bool:
         """
-        Return True if
+        Return True if the move is legal; otherwise print which condition of
+        get_move_error failed and return False.
+        :param src_pos: str, location of pawn being moved
+        :param dest_pos: str, location of where the pawn will be moved
+        :return: bool
+        """
+        error = self.get_move_error(src_pos, dest_pos)
+        if error is not None:
+            print(f"Error: {error}")
+            return False
+        return True
+
+    def get_move_error(self, src_pos: str, dest_pos: str):
+        """
+        Return None if
         (0) the game is not over
         (1) the pawn belongs to the player making the turn
         (2) the move is not off the board
         (3) the dest_pos is vacant
         (4) the pawn is only moving horizontally or vertically
         (5) the pawn can move legally without encountering pawns on its path
-        Otherwise, return False.
+        Otherwise, return the number of the first condition that fails.
+        Prints nothing.
         :param src_pos: str, location of pawn being moved
         :param dest_pos: str, location of where the pawn will be moved
-        :return: bool
+        :return: int between 0-5, or None
         """
         src_pawn = self._board.get_square(src_pos)
         dest_pawn = self._board.get_square(dest_pos)
@@ -146,31 +186,54 @@ class HasamiShogiGame:
 
         # (0) the game is not over
         if self.get_game_state() != 'UNFINISHED':
-            print("Error: 0")
-            return False
+            return 0
         # (1) the pawn belongs to the player making the turn
         elif src_pawn.get_color() != self.get_active_player():
-            print("Error: 1")
-            return False
+            return 1
         # (2) the move is not off the board
         elif 0 > src_indices[0] > 8 or 0 > src_indices[1] > 8 \
                 or 0 > dest_indices[0] > 8 or 0 > dest_indices[1] > 8:
-            print("Error: 2")
-            return False
+            return 2
         # (3) the dest_pos is vacant
         elif dest_pawn.get_color() != "NONE":
-            print("Error: 3")
-            return False
+            return 3
         # (4) the pawn is only moving horizontally or vertically
         elif src_pos[0] != dest_pos[0] and src_pos[1] != dest_pos[1]:
-            print("Error: 4")
-            return False
+            return 4
         # (5) the pawn can move legally without encountering pawns on its path
         elif not self.check_if_clear_path(src_pos, dest_pos):
-            print("Error: 5")
-            return False
+            return 5
         else:
-            return True
+            return None
+
+    def get_legal_moves(self) -> list:
+        """
+        Return every legal move for the active player as a list of
+        (src_pos, dest_pos) tuples. Pawns slide horizontally or vertically
+        until they reach the edge of the board or another pawn. Return an
+        empty list if the game is over.
+        :return: list of tuples of two strs
+        """
+        if self.get_game_state() != 'UNFINISHED':
+            return []
+        color = self.get_active_player()
+        the_list = self._board.get_board_list()
+        moves = []
+        for row in range(9):
+            for col in range(9):
+                if the_list[row][col].get_color() != color:
+                    continue
+                src_pos = self._board.to_notation(row, col)
+                for row_step, col_step in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+                    dest_row = row + row_step
+                    dest_col = col + col_step
+                    while 0 <= dest_row <= 8 and 0 <= dest_col <= 8 and \
+                            the_list[dest_row][dest_col].get_color() == 'NONE':
+                        dest_pos = self._board.to_notation(dest_row, dest_col)
+                        moves.append((src_pos, dest_pos))
+                        dest_row += row_step
+                        dest_col += col_step
+        return moves
 
     def check_if_clear_path(self, src_pos: str, dest_pos: str) -> bool:
         """
@@ -206,16 +269,16 @@ class HasamiShogiGame:
 
         return True
 
-    def capture(self, pos: str) -> bool:
+    def capture(self, pos: str) -> list:
         """
-        Return True if the pawn at dest_pos
+        Remove and return the positions of the pawns captured because the
+        pawn at pos
         (1) completes "sandwich" between 1 or more opponent pawns either
         horizontally or vertically
         (2) completes orthogonal capture of a corner square
-        If True, remove captured pawn.
-        Otherwise, return False.
+        Return an empty list if nothing is captured.
         :param pos: str, location of where the pawn has been moved
-        :return: bool
+        :return: list of str, sorted
         """
         player_color = self._board.get_square(pos).get_color()
         opponent_color = ""
@@ -230,17 +293,18 @@ class HasamiShogiGame:
         bottom = self.bottom_capture(pos, player_color, opponent_color)
         corner = self.corner_capture()
 
-        return left or right or top or bottom or corner
+        return sorted(set(left + right + top + bottom + corner))
 
-    def left_capture(self, pos: str, player_color: str, opponent_color: str) -> bool:
+    def left_capture(self, pos: str, player_color: str, opponent_color: str) -> list:
         """
-        Return True if pos completes a left capture of one or more opponent pawns.
+        Return the positions of the opponent pawns removed because pos
+        completes a left capture. Return an empty list if there is none.
         :param pos: str
         :param player_color: str
         :param opponent_color: str
-        :return: bool
+        :return: list of str
         """
-        captured_flag = False
+        removed_list = []
         captured_list = []  # list of captured positions (in alg. notation)
         indices = self._board.translate(pos)
         row_index: int = indices[0] + 1
@@ -259,22 +323,23 @@ class HasamiShogiGame:
                     elif temp_pawn.get_color() == player_color:
                         for captured_pos in captured_list:
                             self._board.remove_pawn(captured_pos)
-                            captured_flag = True
+                            removed_list.append(captured_pos)
                         break
                     else:
                         break
             captured_list = []
-            return captured_flag
+        return removed_list
 
-    def right_capture(self, pos: str, player_color: str, opponent_color: str) -> bool:
+    def right_capture(self, pos: str, player_color: str, opponent_color: str) -> list:
         """
-        Return True if pos completes a right capture of one or more opponent pawns.
+        Return the positions of the opponent pawns removed because pos
+        completes a right capture. Return an empty list if there is none.
         :param pos: str
         :param player_color: str
         :param opponent_color: str
-        :return: bool
+        :return: list of str
         """
-        captured_flag = False
+        removed_list = []
         captured_list = []  # list of captured positions (in alg. notation)
         indices = self._board.translate(pos)
         row_index: int = indices[0] + 1
@@ -294,22 +359,23 @@ class HasamiShogiGame:
                     elif temp_pawn.get_color() == player_color:
                         for captured_pos in captured_list:
                             self._board.remove_pawn(captured_pos)
-                            captured_flag = True
+                            removed_list.append(captured_pos)
                         break
                     else:
                         break
             captured_list = []
-            return captured_flag
+        return removed_list
 
-    def top_capture(self, pos: str, player_color: str, opponent_color: str) -> bool:
+    def top_capture(self, pos: str, player_color: str, opponent_color: str) -> list:
         """
-        Return True if pos completes a top capture of one or more opponent pawns.
+        Return the positions of the opponent pawns removed because pos
+        completes a top capture. Return an empty list if there is none.
         :param pos: str
         :param player_color: str
         :param opponent_color: str
-        :return: bool
+        :return: list of str
         """
-        captured_flag = False
+        removed_list = []
         captured_list = []  # list of captured positions (in alg. notation)
         indices = self._board.translate(pos)
         row_index: int = indices[0] + 1
@@ -330,22 +396,23 @@ class HasamiShogiGame:
                     elif temp_pawn.get_color() == player_color:
                         for captured_pos in captured_list:
                             self._board.remove_pawn(captured_pos)
-                            captured_flag = True
+                            removed_list.append(captured_pos)
                         break
                     else:
                         break
             captured_list = []
-            return captured_flag
+        return removed_list
 
-    def bottom_capture(self, pos: str, player_color: str, opponent_color: str) -> bool:
+    def bottom_capture(self, pos: str, player_color: str, opponent_color: str) -> list:
         """
-        Return True if pos completes a bottom capture of one or more opponent pawns.
+        Return the positions of the opponent pawns removed because pos
+        completes a bottom capture. Return an empty list if there is none.
         :param pos: str
         :param player_color: str
         :param opponent_color: str
-        :return: bool
+        :return: list of str
         """
-        captured_flag = False
+        removed_list = []
         captured_list = []  # list of captured positions (in alg. notation)
         indices = self._board.translate(pos)
         row_index: int = indices[0] + 1
@@ -366,18 +433,18 @@ class HasamiShogiGame:
                     elif temp_pawn.get_color() == player_color:
                         for captured_pos in captured_list:
                             self._board.remove_pawn(captured_pos)
-                            captured_flag = True
+                            removed_list.append(captured_pos)
                         break
                     else:
                         break
             captured_list = []
-            return captured_flag
+        return removed_list
 
-    def corner_capture(self) -> bool:
+    def corner_capture(self) -> list:
         """
-        Return True and remove corner pawn if it is captured orthogonally.
-        Otherwise, return False.
-        :return: bool
+        Remove corner pawn if it is captured orthogonally and return its
+        position in a list. Otherwise, return an empty list.
+        :return: list of str
         """
         top_left = self._board.get_square('a1')
         if self._board.get_square('b1').get_color() != top_left.get_color() and \
@@ -385,29 +452,29 @@ class HasamiShogiGame:
                 self._board.get_square('a2').get_color() != top_left.get_color() and \
                 self._board.get_square('a2').get_color() != 'NONE':
             self._board.remove_pawn('a1')
-            return True
+            return [] if top_left.get_color() == 'NONE' else ['a1']
         top_right = self._board.get_square('a9')
         if self._board.get_square('a8').get_color() != top_right.get_color() and \
                 self._board.get_square('a8').get_color() != 'NONE' and \
                 self._board.get_square('b9').get_color() != top_right.get_color() and \
                 self._board.get_square('b9').get_color() != 'NONE':
             self._board.remove_pawn('a9')
-            return True
+            return [] if top_right.get_color() == 'NONE' else ['a9']
         bottom_left = self._board.get_square('i1')
         if self._board.get_square('h1').get_color() != bottom_left.get_color() and \
                 self._board.get_square('h1').get_color() != 'NONE' and \
                 self._board.get_square('i2').get_color() != bottom_left.get_color() and \
                 self._board.get_square('i2').get_color() != 'NONE':
             self._board.remove_pawn('i1')
-            return True
+            return [] if bottom_left.get_color() == 'NONE' else ['i1']
         bottom_right = self._board.get_square('i9')
         if self._board.get_square('h9').get_color() != bottom_right.get_color() and \
                 self._board.get_square('h9').get_color() != 'NONE' and \
                 self._board.get_square('i8').get_color() != bottom_right.get_color() and \
                 self._board.get_square('i8').get_color() != 'NONE':
             self._board.remove_pawn('i9')
-            return True
-        return False
+            return [] if bottom_right.get_color() == 'NONE' else ['i9']
+        return []
 
     def get_square_occupant(self, pos: str) -> str:
         """
@@ -550,7 +617,40 @@ class Board:
         """
         self._board_list = new_list
 
-    def translate(self, notation: str) -> tuple:
+    def copy(self):
+        """
+        Return a new Board with the same squares and pawn counts. Squares are
+        only ever replaced, never mutated in place, so the Pawns are shared.
+        :return: Board
+        """
+        # skip __init__ so no starting board is built only to be replaced
+        new_board = Board.__new__(Board)
+        new_board._board_list = [row[:] for row in self._board_list]
+        new_board._num_pawns_red = self._num_pawns_red
+        new_board._num_pawns_black = self._num_pawns_black
+        return new_board
+
+    def encode(self) -> str:
+        """
+        Return a compact 81-character string of the board, row a first, using
+        the Pawn string representation for each square ('R', 'B', or '.').
+        :return: str
+        """
+        return ''.join(str(square) for row in self._board_list for square in row)
+
+    @staticmethod
+    def is_valid_notation(notation) -> bool:
+        """
+        Return True if notation names a square on the board: one letter a-i
+        followed by one number 1-9 (ex. 'a1'). Otherwise, return False.
+        :param notation: value to check
+        :return: bool
+        """
+        return isinstance(notation, str) and len(notation) == 2 and \
+            notation[0] in 'abcdefghi' and notation[1] in '123456789'
+
+    @staticmethod
+    def translate(notation: str) -> tuple:
         """
         Convert algebraic notation of a square (ex. 'a1') to the matching
         pair of indices in the list of lists. Return pair of indices as a tuple.
@@ -563,6 +663,17 @@ class Board:
         col_index = int(notation[1]) - 1
         return row_index, col_index
 
+    @staticmethod
+    def to_notation(row_index: int, col_index: int) -> str:
+        """
+        Convert a pair of indices in the list of lists to the algebraic
+        notation of the square (ex. (0, 0) -> 'a1'). Reverse of translate.
+        :param row_index: int between 0-8
+        :param col_index: int between 0-8
+        :return: str
+        """
+        return 'abcdefghi'[row_index] + str(col_index + 1)
+
     def get_square(self, pos: str) -> Pawn:
         """
         Return the Pawn at pos. If square is empty, return None.
@@ -0,0 +1,214 @@
+# Date: 10/19/26
+# Description: This program serializes Hasami Shogi positions for spectators.
+# A full snapshot describes the whole position and a per-move delta describes
+# only the moved pawn, the captured squares, and the new game state. The
+# SpectatorBroadcaster encodes each message once and sends the same bytes to
+# every subscriber.
+
+import json
+
+from HasamiShogiGame import Board, HasamiShogiGame
+
+SEPARATORS = (',', ':')  # no whitespace in encoded messages
+
+
+def to_index(pos: str) -> int:
+    """
+    Convert algebraic notation to an index into the string from Board.encode.
+    :param pos: str, algebraic notation of square
+    :return: int between 0-80
+    """
+    row_index, col_index = Board.translate(pos)
+    return row_index * 9 + col_index
+
+
+def make_snapshot(game: HasamiShogiGame, seq: int = 0) -> dict:
+    """
+    Return a full snapshot of the position. 'board' is the 81-character
+    string from Board.encode.
+    :param game: HasamiShogiGame
+    :param seq: int, number of moves broadcast so far
+    :return: dict
+    """
+    board = game.get_board()
+    return {'type': 'snapshot', 'seq': seq, 'board': board.encode(),
+            'turn': game.get_active_player(),
+            'state': game.get_game_state(),
+            'red': board.get_num_pawns('RED'),
+            'black': board.get_num_pawns('BLACK')}
+
+
+def make_delta(game: HasamiShogiGame, seq: int, src_pos: str, dest_pos: str,
+               captured: list) -> dict:
+    """
+    Return a delta describing a move that has just been made in game. To
+    keep deltas small they use one-letter keys and hold only what a
+    spectator cannot derive from its snapshot: 'n' is the sequence number,
+    'm' the move as one string (ex. 'i1e1'), 'c' the captured squares as one
+    string (ex. 'h2h3'), and 'g' the game state. The moved pawn's color, the
+    next turn, and the pawn counts are derived by apply_delta.
+    :param game: HasamiShogiGame, position after the move
+    :param seq: int, sequence number of this move (first move is 1)
+    :param src_pos: str, location the pawn moved from
+    :param dest_pos: str, location the pawn moved to
+    :param captured: list of str, locations of the captured pawns
+    :return: dict
+    """
+    move = Board.to_notation(*Board.translate(src_pos)) + \
+        Board.to_notation(*Board.translate(dest_pos))
+    return {'n': seq, 'm': move, 'c': ''.join(captured),
+            'g': game.get_game_state()}
+
+
+def encode(message: dict) -> bytes:
+    """
+    Encode a snapshot or delta as compact UTF-8 JSON.
+    :param message: dict
+    :return: bytes
+    """
+    return json.dumps(message, separators=SEPARATORS).encode('utf-8')
+
+
+def decode(data: bytes) -> dict:
+    """
+    Decode a snapshot or delta produced by encode.
+    :param data: bytes
+    :return: dict
+    """
+    return json.loads(data)
+
+
+def is_delta(message: dict) -> bool:
+    """
+    Return True if a decoded message is a delta; false if it is a snapshot.
+    :param message: dict
+    :return: bool
+    """
+    return 'type' not in message
+
+
+def apply_delta(snapshot: dict, delta: dict) -> dict:
+    """
+    Return the snapshot reached by applying delta to snapshot. Used by
+    spectators to keep their own copy of the position up to date.
+    Raise ValueError if the delta does not directly follow the snapshot.
+    :param snapshot: dict, decoded snapshot
+    :param delta: dict, decoded delta
+    :return: dict, new snapshot
+    """
+    if delta['n'] != snapshot['seq'] + 1:
+        raise ValueError(f"Expected delta {snapshot['seq'] + 1}, "
+                         f"got {delta['n']}")
+    squares = list(snapshot['board'])
+    src_index = to_index(delta['m'][:2])
+    dest_index = to_index(delta['m'][2:])
+    squares[dest_index] = squares[src_index]
+    squares[src_index] = '.'
+    num_pawns = {'R': snapshot['red'], 'B': snapshot['black']}
+    for start in range(0, len(delta['c']), 2):
+        index = to_index(delta['c'][start:start + 2])
+        num_pawns[squares[index]] -= 1
+        squares[index] = '.'
+    if snapshot['turn'] == 'BLACK':
+        turn = 'RED'
+    else:
+        turn = 'BLACK'
+    return {'type': 'snapshot', 'seq': delta['n'], 'board': ''.join(squares),
+            'turn': turn, 'state': delta['g'],
+            'red': num_pawns['R'], 'black': num_pawns['B']}
+
+
+class SpectatorBroadcaster:
+    """
+    A class to broadcast a HasamiShogiGame to spectators. Moves are made
+    through the broadcaster, which encodes one delta per move and sends the
+    same bytes to every subscriber. New subscribers receive the current
+    snapshot, which is encoded at most once per position. A subscriber whose
+    callback raises is treated as disconnected and removed; it must
+    subscribe again to get a fresh snapshot.
+    """
+
+    def __init__(self, game: HasamiShogiGame = None) -> None:
+        """
+        Construct a SpectatorBroadcaster for game, or for a new game if none
+        is given.
+        :param game: HasamiShogiGame or None
+        """
+        if game is None:
+            game = HasamiShogiGame()
+        self._game = game
+        self._seq = 0
+        self._subscribers = []
+        self._snapshot_bytes = None  # cached until the next move
+
+    def get_game(self) -> HasamiShogiGame:
+        """
+        Return the HasamiShogiGame being broadcast.
+        :return: HasamiShogiGame
+        """
+        return self._game
+
+    def get_seq(self) -> int:
+        """
+        Return the number of moves broadcast so far.
+        :return: int
+        """
+        return self._seq
+
+    def subscribe(self, send) -> None:
+        """
+        Send a subscriber the current snapshot and add it. If sending the
+        snapshot raises, the subscriber is not added.
+        :param send: callable taking one bytes argument
+        :return: None
+        """
+        send(self.get_snapshot())
+        self._subscribers.append(send)
+
+    def unsubscribe(self, send) -> None:
+        """
+        Remove a subscriber. If it is not subscribed, do nothing.
+        :param send: callable previously passed to subscribe
+        :return: None
+        """
+        if send in self._subscribers:
+            self._subscribers.remove(send)
+
+    def get_snapshot(self) -> bytes:
+        """
+        Return the encoded snapshot of the current position.
+        :return: bytes
+        """
+        if self._snapshot_bytes is None:
+            self._snapshot_bytes = encode(make_snapshot(self._game, self._seq))
+        return self._snapshot_bytes
+
+    def make_move(self, src_pos: str, dest_pos: str) -> bool:
+        """
+        Make a move in the game. If it is legal, encode the delta once and
+        send it to every subscriber. Subscribers may unsubscribe from inside
+        their callback; a subscriber whose callback raises is removed and the
+        remaining subscribers still receive the delta.
+        Return True if the move is legal; false, otherwise, including when
+        either position is not a square on the board. Prints nothing.
+        :param src_pos: str, location of the pawn being moved
+        :param dest_pos: str, location of where to move the pawn
+        :return: bool
+        """
+        if not Board.is_valid_notation(src_pos) or \
+                not Board.is_valid_notation(dest_pos):
+            return False
+        if self._game.get_move_error(src_pos, dest_pos) is not None:
+            return False
+        captured = self._game.apply_move(src_pos, dest_pos)
+
+        self._seq += 1
+        self._snapshot_bytes = None
+        data = encode(make_delta(self._game, self._seq, src_pos, dest_pos,
+                                 captured))
+        for send in list(self._subscribers):
+            try:
+                send(data)
+            except Exception:
+                self.unsubscribe(send)
+        return True
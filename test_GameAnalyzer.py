@@ -0,0 +1,142 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from GameAnalyzer import analyze_archive, analyze_game, analyze_line
+from HasamiShogiGame import HasamiShogiGame
+
+
+def random_game(game_id: int, num_moves: int) -> dict:
+    """
+    Return an archive record of a game of random legal moves.
+    :param game_id: int, also used as the random seed
+    :param num_moves: int, maximum number of moves
+    :return: dict
+    """
+    rng = random.Random(game_id)
+    game = HasamiShogiGame()
+    moves = []
+    for _ in range(num_moves):
+        legal_moves = game.get_legal_moves()
+        if not legal_moves:
+            break
+        move = rng.choice(legal_moves)
+        game.apply_move(move[0], move[1])
+        moves.append(list(move))
+    return {'game_id': game_id, 'moves': moves}
+
+
+class TestAnalyzeGame(unittest.TestCase):
+    def test_illegal_move_stops_replay(self):
+        record = {'game_id': 1, 'moves': [['i1', 'e1'], ['i2', 'e2']]}
+        annotation = analyze_game(record)
+        self.assertEqual(annotation['plies'], 1)
+        self.assertEqual(annotation['error'], {
+            'ply': 2, 'move': ['i2', 'e2'], 'reason': 'illegal move'})
+
+    def test_missed_capture(self):
+        # Black can capture the red pawn on e2 with i3-e3 at ply 3 and with
+        # f3-e3 at ply 5, but plays neither
+        moves = [['i1', 'e1'], ['a2', 'e2'], ['i3', 'f3'], ['a9', 'b9'],
+                 ['i9', 'h9']]
+        annotation = analyze_game({'game_id': 2, 'moves': moves})
+        self.assertNotIn('error', annotation)
+        self.assertEqual([missed['ply'] for missed
+                          in annotation['missed_captures']], [3, 5])
+        self.assertEqual(annotation['missed_captures'][1], {
+            'ply': 5, 'player': 'BLACK', 'move': ['i9', 'h9'],
+            'captured': 0, 'available': 1})
+        self.assertEqual(annotation['swings'][1]['best_move'], ['f3', 'e3'])
+
+    def test_malformed_move(self):
+        annotation = analyze_game({'game_id': 99, 'moves': [['i1']]})
+        self.assertEqual(annotation['game_id'], 99)
+        self.assertEqual(annotation['error']['reason'], 'malformed move')
+
+    def test_malformed_records(self):
+        self.assertEqual(analyze_line('not json')['error']['reason'],
+                         'invalid JSON')
+        self.assertEqual(analyze_line('[1, 2]')['error']['reason'],
+                         'record is not an object')
+        self.assertEqual(analyze_line('{"moves": 3}')['error']['reason'],
+                         'moves is not a list')
+
+
+class TestAnalyzeArchive(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.archive = os.path.join(self._dir.name, 'games.jsonl')
+        self.output = os.path.join(self._dir.name, 'out.jsonl')
+        self.checkpoint = os.path.join(self._dir.name, 'run.ckpt')
+        with open(self.archive, 'w', encoding='utf-8') as archive:
+            for game_id in range(10):
+                archive.write(json.dumps(random_game(game_id, 12)) + '\n')
+            archive.write('not json\n')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def read_output(self) -> bytes:
+        with open(self.output, 'rb') as output:
+            return output.read()
+
+    def test_output_in_archive_order(self):
+        total = analyze_archive(self.archive, self.output, processes=2,
+                                chunk_size=2)
+        self.assertEqual(total, 11)
+        lines = self.read_output().decode('utf-8').splitlines()
+        game_ids = [json.loads(line)['game_id'] for line in lines]
+        self.assertEqual(game_ids, list(range(10)) + [None])
+
+    def test_resume_from_checkpoint_is_exact(self):
+        analyze_archive(self.archive, self.output, self.checkpoint,
+                        processes=2, chunk_size=3)
+        expected = self.read_output()
+        with open(self.checkpoint, encoding='utf-8') as checkpoint:
+            self.assertEqual(json.load(checkpoint), {
+                'games_done': 11, 'output_bytes': len(expected)})
+
+        # interrupted after two chunks, with a partial third chunk written
+        done = b''.join(expected.splitlines(keepends=True)[:6])
+        with open(self.output, 'wb') as output:
+            output.write(done + b'{"game_id": 6, "plie')
+        with open(self.checkpoint, 'w', encoding='utf-8') as checkpoint:
+            json.dump({'games_done': 6, 'output_bytes': len(done)},
+                      checkpoint)
+
+        total = analyze_archive(self.archive, self.output, self.checkpoint,
+                                processes=2, chunk_size=3)
+        self.assertEqual(total, 11)
+        self.assertEqual(self.read_output(), expected)
+
+    def test_resume_rejects_missing_or_short_output(self):
+        with open(self.checkpoint, 'w', encoding='utf-8') as checkpoint:
+            json.dump({'games_done': 4, 'output_bytes': 100}, checkpoint)
+        with self.assertRaises(ValueError):
+            analyze_archive(self.archive, self.output, self.checkpoint)
+        self.assertFalse(os.path.exists(self.output))
+
+        with open(self.output, 'wb') as output:
+            output.write(b'x' * 99)
+        with self.assertRaises(ValueError):
+            analyze_archive(self.archive, self.output, self.checkpoint)
+        self.assertEqual(self.read_output(), b'x' * 99)
+
+    def test_rejects_arguments_below_one(self):
+        with self.assertRaises(ValueError):
+            analyze_archive(self.archive, self.output, chunk_size=0)
+        with self.assertRaises(ValueError):
+            analyze_archive(self.archive, self.output, depth=0)
+        self.assertFalse(os.path.exists(self.output))
+
+        with open(self.output, 'wb') as output:
+            output.write(b'existing annotations\n')
+        with self.assertRaises(ValueError):
+            analyze_archive(self.archive, self.output, processes=0)
+        self.assertEqual(self.read_output(), b'existing annotations\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+
+from SpectatorBroadcast import SpectatorBroadcaster, apply_delta, decode, \
+    is_delta
+
+
+class TestSpectatorBroadcast(unittest.TestCase):
+    def test_apply_delta_round_trip(self):
+        rng = random.Random(0)
+        for _ in range(10):
+            broadcaster = SpectatorBroadcaster()
+            received = []
+            broadcaster.subscribe(received.append)
+            view = decode(received[0])
+            self.assertFalse(is_delta(view))
+            for _ in range(300):
+                legal_moves = broadcaster.get_game().get_legal_moves()
+                if not legal_moves:
+                    break
+                move = rng.choice(legal_moves)
+                self.assertTrue(broadcaster.make_move(move[0], move[1]))
+                delta = decode(received[-1])
+                self.assertTrue(is_delta(delta))
+                view = apply_delta(view, delta)
+                self.assertEqual(view, decode(broadcaster.get_snapshot()))
+
+    def test_delta_lists_captured_squares(self):
+        broadcaster = SpectatorBroadcaster()
+        received = []
+        broadcaster.subscribe(received.append)
+        for src_pos, dest_pos in [('i1', 'e1'), ('a2', 'e2'), ('i3', 'e3')]:
+            broadcaster.make_move(src_pos, dest_pos)
+        self.assertEqual(decode(received[-1]), {
+            'n': 3, 'm': 'i3e3', 'c': 'e2', 'g': 'UNFINISHED'})
+
+    def test_out_of_sequence_delta_rejected(self):
+        broadcaster = SpectatorBroadcaster()
+        received = []
+        broadcaster.subscribe(received.append)
+        broadcaster.make_move('i1', 'e1')
+        broadcaster.make_move('a1', 'd1')
+        with self.assertRaises(ValueError):
+            apply_delta(decode(received[0]), decode(received[2]))
+
+    def test_illegal_move_not_broadcast(self):
+        broadcaster = SpectatorBroadcaster()
+        received = []
+        broadcaster.subscribe(received.append)
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            self.assertFalse(broadcaster.make_move('a1', 'b1'))
+            self.assertFalse(broadcaster.make_move('i1', 'h2'))
+        self.assertEqual(stdout.getvalue(), '')
+        self.assertEqual(len(received), 1)
+        self.assertEqual(broadcaster.get_seq(), 0)
+
+    def test_bad_notation_not_broadcast(self):
+        broadcaster = SpectatorBroadcaster()
+        received = []
+        broadcaster.subscribe(received.append)
+        for src_pos, dest_pos in [('i10', 'e1'), ('i1', 'j1'), ('', ''),
+                                  ('i1', 'e0'), (None, 'e1')]:
+            self.assertFalse(broadcaster.make_move(src_pos, dest_pos))
+        self.assertEqual(len(received), 1)
+        self.assertEqual(broadcaster.get_seq(), 0)
+
+    def test_fan_out_shares_bytes(self):
+        broadcaster = SpectatorBroadcaster()
+        received = [[], [], []]
+        for messages in received:
+            broadcaster.subscribe(messages.append)
+        broadcaster.make_move('i1', 'e1')
+        self.assertIs(received[0][0], received[2][0])
+        self.assertIs(received[0][1], received[1][1])
+        self.assertIs(received[0][1], received[2][1])
+
+    def test_unsubscribe_during_fan_out(self):
+        broadcaster = SpectatorBroadcaster()
+        received = []
+
+        def leave(data):
+            if is_delta(decode(data)):
+                broadcaster.unsubscribe(leave)
+
+        broadcaster.subscribe(leave)
+        broadcaster.subscribe(received.append)
+        broadcaster.make_move('i1', 'e1')
+        self.assertEqual(len(received), 2)
+
+    def test_failing_subscriber_removed(self):
+        broadcaster = SpectatorBroadcaster()
+        received = []
+
+        def fail(data):
+            if is_delta(decode(data)):
+                raise OSError("connection closed")
+
+        broadcaster.subscribe(fail)
+        broadcaster.subscribe(received.append)
+        broadcaster.make_move('i1', 'e1')
+        broadcaster.make_move('a1', 'd1')
+        self.assertEqual(len(received), 3)
+        view = decode(received[0])
+        for data in received[1:]:
+            view = apply_delta(view, decode(data))
+        self.assertEqual(view, decode(broadcaster.get_snapshot()))
+
+    def test_failing_snapshot_not_subscribed(self):
+        broadcaster = SpectatorBroadcaster()
+        calls = []
+
+        def fail(data):
+            calls.append(data)
+            raise OSError("connection closed")
+
+        with self.assertRaises(OSError):
+            broadcaster.subscribe(fail)
+        self.assertTrue(broadcaster.make_move('i1', 'e1'))
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()